@@ -1,4 +1,6 @@
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
 from typing import FrozenSet
 
@@ -9,7 +11,6 @@ import entities
 import s3
 import schedule
 import sso
-from entities import BaseModel
 from statement import GroupStatement, Statement, get_affected_group_statements, get_affected_statements
 
 logger = config.get_logger("access_control")
@@ -20,6 +21,9 @@ org_client = session.client("organizations")
 sso_client = session.client("sso-admin")
 identitystore_client = session.client("identitystore")
 schedule_client = session.client("scheduler")
+# Used by both the account and the group request handlers, and kept across invocations of a warm container,
+# so worker threads are not started for every request.
+executor = ThreadPoolExecutor(max_workers=2)
 
 
 class DecisionReason(Enum):
@@ -30,29 +34,39 @@ class DecisionReason(Enum):
     NoApprovers = "NoApprovers"
 
 
-class AccessRequestDecision(BaseModel):
+@dataclass(frozen=True)
+class AccessRequestDecision:
     grant: bool
     reason: DecisionReason
     based_on_statements: FrozenSet[Statement] | FrozenSet[GroupStatement]
     approvers: FrozenSet[str] = frozenset()
 
 
+# Decisions are immutable, so the most common denial can be shared instead of being built on every request.
+NO_STATEMENTS_DECISION = AccessRequestDecision(grant=False, reason=DecisionReason.NoStatements, based_on_statements=frozenset())
+
+
 def determine_affected_statements(
     statements: FrozenSet[Statement] | FrozenSet[GroupStatement],
     account_id: str | None = None,
     permission_set_name: str | None = None,
     group_id: str | None = None,
 ) -> FrozenSet[Statement] | FrozenSet[GroupStatement]:
-    if isinstance(statements, FrozenSet) and all(isinstance(item, Statement) for item in statements):
+    if not statements:
+        return frozenset()
+
+    # Statement sets are never mixed, so the type of any element tells which kind of statements we have.
+    sample = next(iter(statements))
+    if isinstance(sample, Statement):
         return get_affected_statements(statements, account_id, permission_set_name)  # type: ignore # noqa: PGH003
 
-    if isinstance(statements, FrozenSet) and all(isinstance(item, GroupStatement) for item in statements):
+    if isinstance(sample, GroupStatement):
         return get_affected_group_statements(statements, group_id)  # type: ignore # noqa: PGH003
 
     # About type ignore:
     # For some reason, pylance is not able to understand that we already checked the type of the items in the set,
     # and shows a type error for "statements"
-    raise TypeError("Statements contain mixed or unsupported types.")
+    raise TypeError("Statements contain unsupported types.")
 
 
 def make_decision_on_access_request(  # noqa: PLR0911
@@ -63,55 +77,62 @@ def make_decision_on_access_request(  # noqa: PLR0911
     group_id: str | None = None,
 ) -> AccessRequestDecision:
     affected_statements = determine_affected_statements(statements, account_id, permission_set_name, group_id)
+    if not affected_statements:
+        return NO_STATEMENTS_DECISION
 
-    decision_based_on_statements: set[Statement] | set[GroupStatement] = set()
     potential_approvers = set()
+    requester = frozenset([requester_email])
 
-    explicit_deny_self_approval = any(
-        statement.allow_self_approval is False and requester_email in statement.approvers for statement in affected_statements
-    )
-    explicit_deny_approval_not_required = any(statement.approval_is_not_required is False for statement in affected_statements)
+    explicit_deny_self_approval = False
+    explicit_deny_approval_not_required = False
+    # Statements that can grant access on their own. They are checked only after the loop,
+    # when it is known whether any other statement explicitly denies that kind of grant.
+    grant_candidates: list[tuple[Statement | GroupStatement, bool, bool]] = []
 
     for statement in affected_statements:
-        if statement.approval_is_not_required and not explicit_deny_approval_not_required:
+        other_approvers = statement.approvers - requester
+        requester_is_approver = len(other_approvers) != len(statement.approvers)
+        approval_is_not_required = bool(statement.approval_is_not_required)
+        self_approval = requester_is_approver and bool(statement.allow_self_approval)
+
+        explicit_deny_self_approval |= requester_is_approver and statement.allow_self_approval is False
+        explicit_deny_approval_not_required |= statement.approval_is_not_required is False
+        if approval_is_not_required or self_approval:
+            grant_candidates.append((statement, approval_is_not_required, self_approval))
+
+        potential_approvers |= other_approvers
+
+    for statement, approval_is_not_required, self_approval in grant_candidates:
+        if approval_is_not_required and not explicit_deny_approval_not_required:
             return AccessRequestDecision(
                 grant=True,
                 reason=DecisionReason.ApprovalNotRequired,
                 based_on_statements=frozenset([statement]),  # type: ignore # noqa: PGH003
             )
-        if requester_email in statement.approvers and statement.allow_self_approval and not explicit_deny_self_approval:
+        if self_approval and not explicit_deny_self_approval:
             return AccessRequestDecision(
                 grant=True,
                 reason=DecisionReason.SelfApproval,
                 based_on_statements=frozenset([statement]),  # type: ignore # noqa: PGH003
             )
 
-        decision_based_on_statements.add(statement)  # type: ignore # noqa: PGH003
-        potential_approvers.update(approver for approver in statement.approvers if approver != requester_email)
-
-    if not decision_based_on_statements:
-        return AccessRequestDecision(
-            grant=False,
-            reason=DecisionReason.NoStatements,
-            based_on_statements=frozenset(decision_based_on_statements),
-        )
-
     if not potential_approvers:
         return AccessRequestDecision(
             grant=False,
             reason=DecisionReason.NoApprovers,
-            based_on_statements=frozenset(decision_based_on_statements),
+            based_on_statements=affected_statements,
         )
 
     return AccessRequestDecision(
         grant=False,
         reason=DecisionReason.RequiresApproval,
         approvers=frozenset(potential_approvers),
-        based_on_statements=frozenset(decision_based_on_statements),
+        based_on_statements=affected_statements,
     )
 
 
-class ApproveRequestDecision(BaseModel):
+@dataclass(frozen=True)
+class ApproveRequestDecision:
     """Decision on approver request
 
     grant: bool - Create account assignment, if grant is True
@@ -135,15 +156,16 @@ def make_decision_on_approve_request(  # noqa: PLR0913
 ) -> ApproveRequestDecision:
     affected_statements = determine_affected_statements(statements, account_id, permission_set_name, group_id)
 
+    is_self_approval = approver_email == requester_email
+    grant = action is entities.ApproverAction.Approve
+
     for statement in affected_statements:
-        if approver_email in statement.approvers:
-            is_self_approval = approver_email == requester_email
-            if is_self_approval and statement.allow_self_approval or not is_self_approval:
-                return ApproveRequestDecision(
-                    grant=action == entities.ApproverAction.Approve,
-                    permit=True,
-                    based_on_statements=frozenset([statement]),  # type: ignore # noqa: PGH003
-                )
+        if approver_email in statement.approvers and (not is_self_approval or statement.allow_self_approval):
+            return ApproveRequestDecision(
+                grant=grant,
+                permit=True,
+                based_on_statements=frozenset([statement]),  # type: ignore # noqa: PGH003
+            )
 
     return ApproveRequestDecision(
         grant=False,
@@ -167,8 +189,13 @@ def execute_decision(  # noqa: PLR0913
         return False  # Temporary solution for testing
 
     sso_instance = sso.describe_sso_instance(sso_client, cfg.sso_instance_arn)
-    permission_set = sso.get_permission_set_by_name(sso_client, sso_instance.arn, permission_set_name)
-    user_principal_id = sso.get_user_principal_id_by_email(identitystore_client, sso_instance.identity_store_id, requester.email)
+    # Permission set and user lookups are independent AWS API calls, so they are made concurrently.
+    permission_set_future = executor.submit(sso.get_permission_set_by_name, sso_client, sso_instance.arn, permission_set_name)
+    user_principal_id_future = executor.submit(
+        sso.get_user_principal_id_by_email, identitystore_client, sso_instance.identity_store_id, requester.email
+    )
+    permission_set = permission_set_future.result()
+    user_principal_id = user_principal_id_future.result()
     account_assignment = sso.UserAccountAssignment(
         instance_arn=sso_instance.arn,
         account_id=account_id,
@@ -205,12 +232,7 @@ def execute_decision(  # noqa: PLR0913
         schedule_client=schedule_client,
         approver=approver,
         requester=requester,
-        user_account_assignment=sso.UserAccountAssignment(
-            instance_arn=sso_instance.arn,
-            account_id=account_id,
-            permission_set_arn=permission_set.arn,
-            user_principal_id=user_principal_id,
-        ),
+        user_account_assignment=account_assignment,
     )
     return True  # Temporary solution for testing
 
@@ -0,0 +1,36 @@
+import time
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Lambda containers are reused between invocations, so caches created at module level survive across requests.
+_caches: list["TTLCache"] = []
+
+
+class TTLCache(Generic[K, V]):
+    """Keeps computed values for a limited time.
+
+    Values that fail to compute (the factory raises) are not stored, so lookups that end in errors.NotFound
+    are retried on the next call.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:  # noqa: ANN101
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[K, tuple[V, float]] = {}
+        _caches.append(self)
+
+    def get_or_set(self, key: K, factory: Callable[[], V]) -> V:  # noqa: ANN101
+        if (entry := self._entries.get(key)) is not None and entry[1] > time.monotonic():
+            return entry[0]
+        value = factory()
+        self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+        return value
+
+    def clear(self) -> None:  # noqa: ANN101
+        self._entries.clear()
+
+
+def clear_all() -> None:
+    for ttl_cache in _caches:
+        ttl_cache.clear()
@@ -20,18 +20,23 @@ def get_logger(service: Optional[str] = None, level: Optional[str] = None) -> Lo
 
 logger = get_logger(service="config")
 
+# Default for a missing "Approvers" key, so no empty set is allocated just to be passed to dict.get.
+# Pydantic still builds a new frozenset for every statement when it validates the approvers field.
+EMPTY_APPROVERS: frozenset[str] = frozenset()
+
+
+def to_set_if_list_or_str(v: list | str | frozenset[str]) -> frozenset[str]:
+    if isinstance(v, list):
+        return frozenset(v)
+    return frozenset([v]) if isinstance(v, str) else v
 
-def parse_statement(_dict: dict) -> Statement:
-    def to_set_if_list_or_str(v: list | str) -> frozenset[str]:
-        if isinstance(v, list):
-            return frozenset(v)
-        return frozenset([v]) if isinstance(v, str) else v
 
+def parse_statement(_dict: dict) -> Statement:
     return Statement.parse_obj(
         {
             "permission_set": to_set_if_list_or_str(_dict["PermissionSet"]),
             "resource": to_set_if_list_or_str(_dict["Resource"]),
-            "approvers": to_set_if_list_or_str(_dict.get("Approvers", set())),
+            "approvers": to_set_if_list_or_str(_dict.get("Approvers", EMPTY_APPROVERS)),
             "resource_type": _dict.get("ResourceType"),
             "approval_is_not_required": _dict.get("ApprovalIsNotRequired"),
             "allow_self_approval": _dict.get("AllowSelfApproval"),
@@ -40,15 +45,10 @@ def parse_statement(_dict: dict) -> Statement:
 
 
 def parse_group_statement(_dict: dict) -> GroupStatement:
-    def to_set_if_list_or_str(v: list | str) -> frozenset[str]:
-        if isinstance(v, list):
-            return frozenset(v)
-        return frozenset([v]) if isinstance(v, str) else v
-
     return GroupStatement.parse_obj(
         {
             "resource": to_set_if_list_or_str(_dict["Resource"]),
-            "approvers": to_set_if_list_or_str(_dict.get("Approvers", set())),
+            "approvers": to_set_if_list_or_str(_dict.get("Approvers", EMPTY_APPROVERS)),
             "approval_is_not_required": _dict.get("ApprovalIsNotRequired"),
             "allow_self_approval": _dict.get("AllowSelfApproval"),
         }
@@ -119,10 +119,17 @@ class Config(BaseSettings):
         permission_sets = set()
         accounts = set()
         s3_bucket_prefix_for_partitions = values.get("s3_bucket_prefix_for_partitions", "").rstrip("/")
+        # A wildcard already covers every account or permission set, so once it is found
+        # the explicit names are dropped and not collected from the remaining statements.
         for statement in statements:
-            permission_sets.update(statement.permission_set)
-            if statement.resource_type == "Account":
+            if "*" not in permission_sets:
+                permission_sets.update(statement.permission_set)
+                if "*" in permission_sets:
+                    permission_sets = {"*"}
+            if statement.resource_type == "Account" and "*" not in accounts:
                 accounts.update(statement.resource)
+                if "*" in accounts:
+                    accounts = {"*"}
         return values | {
             "accounts": accounts,
             "permission_sets": permission_sets,
@@ -23,11 +23,13 @@ class BaseModel(PydanticBaseModel):
         return PydanticBaseModel.dict(cp, *args, **kwargs)
 
 
-def json_default(o: object) -> str | dict:
+def json_default(o: object) -> str | dict | list:
     if isinstance(o, PydanticBaseModel):
         return o.dict()
     elif dataclasses.is_dataclass(o):
         return dataclasses.asdict(o)
+    elif isinstance(o, (set, frozenset)):
+        return list(o)
     elif isinstance(o, enum.Enum):
         return o.value
     return str(o)
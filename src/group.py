@@ -155,7 +155,7 @@ def handle_group_button_click(body: dict, client: WebClient, context: BoltContex
     cache_for_dublicate_requests["requester_slack_id"] = payload.request.requester_slack_id
     cache_for_dublicate_requests["group_id"] = payload.request.group_id
 
-    if payload.action == entities.ApproverAction.Discard:
+    if payload.action is entities.ApproverAction.Discard:
         blocks = slack_helpers.HeaderSectionBlock.set_color_coding(
             blocks=payload.message["blocks"],
             color_coding_emoji=cfg.bad_result_emoji,
@@ -212,10 +212,15 @@ def handle_group_button_click(body: dict, client: WebClient, context: BoltContex
         text=text,
     )
 
+    group_future = access_control.executor.submit(sso.describe_group, identity_store_id, payload.request.group_id, identity_store_client)
+    user_principal_id_future = access_control.executor.submit(
+        sso.get_user_principal_id_by_email, identity_store_client, sso_instance.identity_store_id, requester.email
+    )
+
     access_control.execute_decision_on_group_request(
         decision=decision,
-        group=sso.describe_group(identity_store_id, payload.request.group_id, identity_store_client),
-        user_principal_id=sso.get_user_principal_id_by_email(identity_store_client, sso_instance.identity_store_id, requester.email),
+        group=group_future.result(),
+        user_principal_id=user_principal_id_future.result(),
         permission_duration=payload.request.permission_duration,
         approver=approver,
         requester=requester,
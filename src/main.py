@@ -138,7 +138,7 @@ def handle_button_click(body: dict, client: WebClient, context: BoltContext) ->
     cache_for_dublicate_requests["account_id"] = payload.request.account_id
     cache_for_dublicate_requests["permission_set_name"] = payload.request.permission_set_name
 
-    if payload.action == entities.ApproverAction.Discard:
+    if payload.action is entities.ApproverAction.Discard:
         blocks = slack_helpers.HeaderSectionBlock.set_color_coding(
             blocks=payload.message["blocks"],
             color_coding_emoji=cfg.bad_result_emoji,
@@ -1,14 +1,22 @@
 from mypy_boto3_organizations import OrganizationsClient, type_defs
 
+import cache
 import config
 from entities.aws import Account
 
+# The account list is kept for a short time instead of being paginated through on every request form.
+accounts_cache: cache.TTLCache[str, tuple[Account, ...]] = cache.TTLCache(ttl_seconds=300)
+
 
 def parse_account(td: type_defs.AccountTypeDef) -> Account:
     return Account.parse_obj({"id": td.get("Id"), "name": td.get("Name")})
 
 
 def list_accounts(client: OrganizationsClient) -> list[Account]:
+    return list(accounts_cache.get_or_set("accounts", lambda: tuple(fetch_accounts(client))))
+
+
+def fetch_accounts(client: OrganizationsClient) -> list[Account]:
     accounts = []
     paginator = client.get_paginator("list_accounts")
     for page in paginator.paginate():
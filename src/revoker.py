@@ -319,7 +319,7 @@ def handle_check_on_inconsistency(  # noqa: PLR0913
 ) -> None:
     account_assignments = sso.get_account_assignment_information(sso_client, cfg, org_client)
     scheduled_revoke_events = schedule.get_scheduled_events(scheduler_client)
-    account_assignments_from_events = [
+    account_assignments_from_events = {
         sso.AccountAssignment(
             permission_set_arn=scheduled_event.revoke_event.user_account_assignment.permission_set_arn,
             account_id=scheduled_event.revoke_event.user_account_assignment.account_id,
@@ -328,7 +328,7 @@ def handle_check_on_inconsistency(  # noqa: PLR0913
         )
         for scheduled_event in scheduled_revoke_events
         if isinstance(scheduled_event, ScheduledRevokeEvent)
-    ]
+    }
 
     for account_assignment in account_assignments:
         if account_assignment not in account_assignments_from_events:
@@ -375,7 +375,7 @@ def check_on_groups_inconsistency(  # noqa: PLR0913
     identity_store_id = sso_instance.identity_store_id
     scheduled_revoke_events = schedule.get_scheduled_events(scheduler_client)
     group_assignments = sso.get_group_assignments(identity_store_id, identity_store_client, cfg)
-    group_assignments_from_events = [
+    group_assignments_from_events = {
         sso.GroupAssignment(
             group_name=scheduled_event.revoke_event.group_assignment.group_name,
             group_id=scheduled_event.revoke_event.group_assignment.group_id,
@@ -385,7 +385,7 @@ def check_on_groups_inconsistency(  # noqa: PLR0913
         )
         for scheduled_event in scheduled_revoke_events
         if isinstance(scheduled_event, ScheduledGroupRevokeEvent)
-    ]
+    }
     for group_assignment in group_assignments:
         if group_assignment not in group_assignments_from_events:
             logger.warning("Group assignment is not in the scheduled events", extra={"assignment": group_assignment})
@@ -427,7 +427,7 @@ def handle_sso_elevator_group_scheduled_revocation(  # noqa: PLR0913
     identity_store_id = sso_instance.identity_store_id
     scheduled_revoke_events = schedule.get_scheduled_events(scheduler_client)
     group_assignments = sso.get_group_assignments(identity_store_id, identity_store_client, cfg)
-    group_assignments_from_events = [
+    group_assignments_from_events = {
         sso.GroupAssignment(
             group_name=scheduled_event.revoke_event.group_assignment.group_name,
             group_id=scheduled_event.revoke_event.group_assignment.group_id,
@@ -437,7 +437,7 @@ def handle_sso_elevator_group_scheduled_revocation(  # noqa: PLR0913
         )
         for scheduled_event in scheduled_revoke_events
         if isinstance(scheduled_event, ScheduledGroupRevokeEvent)
-    ]
+    }
     for group_assignment in group_assignments:
         if group_assignment in group_assignments_from_events:
             logger.info(
@@ -483,7 +483,7 @@ def handle_sso_elevator_scheduled_revocation(  # noqa: PLR0913
     account_assignments = sso.get_account_assignment_information(sso_client, cfg, org_client)
     scheduled_revoke_events = schedule.get_scheduled_events(scheduler_client)
     sso_instance = sso.describe_sso_instance(sso_client, cfg.sso_instance_arn)
-    account_assignments_from_events = [
+    account_assignments_from_events = {
         sso.AccountAssignment(
             permission_set_arn=scheduled_event.revoke_event.user_account_assignment.permission_set_arn,
             account_id=scheduled_event.revoke_event.user_account_assignment.account_id,
@@ -492,7 +492,7 @@ def handle_sso_elevator_scheduled_revocation(  # noqa: PLR0913
         )
         for scheduled_event in scheduled_revoke_events
         if isinstance(scheduled_event, ScheduledRevokeEvent)
-    ]
+    }
     for account_assignment in account_assignments:
         if account_assignment in account_assignments_from_events:
             logger.info(
@@ -136,7 +136,8 @@ def schedule_revoke_event(
     logger.info("Scheduling revoke event")
     schedule_name = f"{cfg.revoker_function_name}" + datetime.now(timezone.utc).strftime("%Y-%m-%d-%H-%M-%S")
     get_and_delete_scheduled_revoke_event_if_already_exist(schedule_client, user_account_assignment)
-    revoke_event = RevokeEvent(
+    # All fields are already typed objects, so the event is only a carrier for serialization and is not revalidated.
+    revoke_event = RevokeEvent.construct(
         schedule_name=schedule_name,
         approver=approver,
         requester=requester,
@@ -172,7 +173,7 @@ def schedule_group_revoke_event(
 ) -> scheduler_type_defs.CreateScheduleOutputTypeDef:
     logger.info("Scheduling revoke event")
     schedule_name = f"{cfg.revoker_function_name}" + datetime.now(timezone.utc).strftime("%Y-%m-%d-%H-%M-%S")
-    revoke_event = GroupRevokeEvent(
+    revoke_event = GroupRevokeEvent.construct(
         schedule_name=schedule_name,
         approver=approver,
         requester=requester,
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import datetime
+import functools
 from datetime import timezone
 import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, Optional, TypeVar
 
+import cache
 import config
 import entities
 import errors
@@ -24,6 +26,11 @@ T = TypeVar("T")
 
 logger = config.get_logger(service="sso")
 
+# Users can be recreated in the Identity Store, so principal ids are cached only for a short time.
+user_principal_id_cache: cache.TTLCache[tuple[str, str], str] = cache.TTLCache(ttl_seconds=300)
+# Listing describes every permission set one by one, so the result is reused for a short time.
+permission_sets_cache: cache.TTLCache[str, tuple[PermissionSet, ...]] = cache.TTLCache(ttl_seconds=300)
+
 
 @dataclass
 class AccountAssignmentStatus:
@@ -82,7 +89,7 @@ class UserAccountAssignment:
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class GroupAssignment:
     group_name: str
     group_id: str
@@ -218,8 +225,9 @@ def list_sso_instances(client: SSOAdminClient) -> list[IAMIdentityCenterInstance
     return instances
 
 
+@functools.lru_cache(maxsize=128)
 def describe_sso_instance(client: SSOAdminClient, instance_arn: str) -> IAMIdentityCenterInstance:
-    """Describe IAM Identity Center Instance
+    """Describe IAM Identity Center Instance. Result is cached, since the instance does not change during the lambda lifetime.
 
     Args:
         instance_arn (str): ARN of the IAM Identity Center Instance
@@ -231,7 +239,7 @@ def describe_sso_instance(client: SSOAdminClient, instance_arn: str) -> IAMIdent
     return next(instance for instance in sso_instances if instance.arn == instance_arn)
 
 
-@dataclass
+@dataclass(frozen=True)
 class AccountAssignment:
     account_id: str
     permission_set_arn: str
@@ -289,7 +297,11 @@ def describe_permission_set(client: SSOAdminClient, sso_instance_arn: str, permi
 
 def get_permission_set_by_name(client: SSOAdminClient, sso_instance_arn: str, permission_set_name: str) -> entities.aws.PermissionSet:
     if ps := next(
-        (permission_set for permission_set in list_permission_sets(client, sso_instance_arn) if permission_set.name == permission_set_name),
+        (
+            permission_set
+            for permission_set in list_permission_sets_cached(client, sso_instance_arn)
+            if permission_set.name == permission_set_name
+        ),
         None,
     ):
         return ps
@@ -307,6 +319,10 @@ def list_permission_sets(client: SSOAdminClient, sso_instance_arn: str) -> Gener
         yield describe_permission_set(client, sso_instance_arn, permission_set_arn)
 
 
+def list_permission_sets_cached(client: SSOAdminClient, sso_instance_arn: str) -> tuple[entities.aws.PermissionSet, ...]:
+    return permission_sets_cache.get_or_set(sso_instance_arn, lambda: tuple(list_permission_sets(client, sso_instance_arn)))
+
+
 def list_users(client: IdentityStoreClient, identity_store_id: str) -> dict:
     paginator = client.get_paginator("list_users")
     r = {"Users": []}
@@ -316,10 +332,18 @@ def list_users(client: IdentityStoreClient, identity_store_id: str) -> dict:
 
 
 def get_user_principal_id_by_email(client: IdentityStoreClient, identity_store_id: str, email: str) -> str:
+    return user_principal_id_cache.get_or_set(
+        (identity_store_id, email),
+        lambda: find_user_principal_id_by_email(client, identity_store_id, email),
+    )
+
+
+def find_user_principal_id_by_email(client: IdentityStoreClient, identity_store_id: str, email: str) -> str:
+    normalized_email = email.lower()
     response = list_users(client, identity_store_id=identity_store_id)
     for user in response["Users"]:
         for user_email in user.get("Emails", []):
-            if user_email.get("Value", "").lower() == email.lower():
+            if user_email.get("Value", "").lower() == normalized_email:
                 return user["UserId"]
 
     raise errors.NotFound(f"AWS SSO User with email {email} not found")
@@ -334,10 +358,11 @@ def get_user_emails(client: IdentityStoreClient, identity_store_id: str, user_id
 
 
 def get_permission_sets_from_config(client: SSOAdminClient, cfg: config.Config) -> list[PermissionSet]:
+    all_permission_sets = list_permission_sets_cached(client, cfg.sso_instance_arn)
     if "*" in cfg.permission_sets:
-        permission_sets = list(list_permission_sets(client, cfg.sso_instance_arn))
+        permission_sets = list(all_permission_sets)
     else:
-        permission_sets = [ps for ps in list_permission_sets(client, cfg.sso_instance_arn) if ps.name in cfg.permission_sets]
+        permission_sets = [ps for ps in all_permission_sets if ps.name in cfg.permission_sets]
     return permission_sets
 
 
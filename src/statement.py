@@ -1,7 +1,8 @@
+import functools
 from enum import Enum
 from typing import FrozenSet, Union
 
-from pydantic import ConstrainedStr, EmailStr, Field
+from pydantic import ConstrainedStr, EmailStr, Field, PrivateAttr
 
 from entities import BaseModel
 
@@ -27,7 +28,22 @@ class WildCard(ConstrainedStr):
     regex = r"^\*$"
 
 
-class BaseStatement(BaseModel):
+class CachedHashModel(BaseModel):
+    """Frozen model that computes its hash once, on first use.
+
+    Statements are hashed whenever they are put into sets, and their fields never change.
+    """
+
+    _hash: int | None = PrivateAttr(default=None)
+
+    def __hash__(self) -> int:  # noqa: ANN101
+        # getattr, because private attributes are not set on instances created without __init__ or construct()
+        if (cached_hash := getattr(self, "_hash", None)) is None:
+            cached_hash = self._hash = super().__hash__()
+        return cached_hash
+
+
+class BaseStatement(CachedHashModel):
     permission_set: FrozenSet[Union[PermissionSetName, WildCard]]
 
     allow_self_approval: bool | None = None
@@ -39,12 +55,31 @@ class Statement(BaseStatement):
     resource_type: ResourceType = Field(ResourceType.Account, const=True)
     resource: FrozenSet[Union[AWSAccountId, WildCard]]
 
+    # Statements are immutable, so wildcards are detected once instead of on every access check.
+    _any_resource: bool = PrivateAttr()
+    _any_permission_set: bool = PrivateAttr()
+
+    def __init__(self, **data) -> None:  # noqa: ANN101, ANN003
+        super().__init__(**data)
+        self._detect_wildcards()
+
+    @classmethod
+    def construct(cls, _fields_set: set[str] | None = None, **values) -> "Statement":  # noqa: ANN102, ANN003
+        statement = super().construct(_fields_set, **values)
+        statement._detect_wildcards()
+        return statement
+
+    def _detect_wildcards(self) -> None:  # noqa: ANN101
+        self._any_resource = "*" in self.resource
+        self._any_permission_set = "*" in self.permission_set
+
     def affects(self, account_id: str, permission_set_name: str) -> bool:  # noqa: ANN101
-        return (account_id in self.resource or "*" in self.resource) and (
-            permission_set_name in self.permission_set or "*" in self.permission_set
+        return (self._any_resource or account_id in self.resource) and (
+            self._any_permission_set or permission_set_name in self.permission_set
         )
 
 
+@functools.lru_cache(maxsize=1024)
 def get_affected_statements(statements: FrozenSet[Statement], account_id: str, permission_set_name: str) -> FrozenSet[Statement]:
     return frozenset(statement for statement in statements if statement.affects(account_id, permission_set_name))
 
@@ -58,7 +93,7 @@ class AWSSSOGroupID(ConstrainedStr):
     regex = r"^([0-9a-f]{10}-)?[A-Fa-f0-9]{8}-[A-Fa-f0-9]{4}-[A-Fa-f0-9]{4}-[A-Fa-f0-9]{4}-[A-Fa-f0-9]{12}$"
 
 
-class GroupStatement(BaseModel):
+class GroupStatement(CachedHashModel):
     resource: FrozenSet[AWSSSOGroupID]
     allow_self_approval: bool | None = None
     approval_is_not_required: bool | None = None
@@ -68,5 +103,6 @@ class GroupStatement(BaseModel):
         return group_id in self.resource
 
 
+@functools.lru_cache(maxsize=1024)
 def get_affected_group_statements(statements: FrozenSet[GroupStatement], group_id: str) -> FrozenSet[GroupStatement]:
     return frozenset(statement for statement in statements if statement.affects(group_id))
@@ -2,6 +2,9 @@ import os
 
 import boto3
 import json
+import pytest
+
+import cache
 
 
 def pytest_sessionstart(session):  # noqa: ANN201, ARG001, ANN001
@@ -49,3 +52,8 @@ def pytest_sessionstart(session):  # noqa: ANN201, ARG001, ANN001
     os.environ |= mock_env
 
     boto3.setup_default_session(region_name="us-east-1")
+
+
+@pytest.fixture(autouse=True)
+def clear_ttl_caches():  # noqa: ANN201
+    cache.clear_all()
@@ -0,0 +1,60 @@
+import pytest
+
+import cache
+
+# ruff: noqa
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def counting_factory(calls: list, value: str = "value"):
+    def factory():
+        calls.append(value)
+        return value
+
+    return factory
+
+
+def test_ttl_cache_hit(clock):
+    ttl_cache = cache.TTLCache(ttl_seconds=300)
+    calls = []
+    assert ttl_cache.get_or_set("key", counting_factory(calls)) == "value"
+    clock[0] += 299
+    assert ttl_cache.get_or_set("key", counting_factory(calls)) == "value"
+    assert len(calls) == 1
+
+
+def test_ttl_cache_expiry(clock):
+    ttl_cache = cache.TTLCache(ttl_seconds=300)
+    calls = []
+    ttl_cache.get_or_set("key", counting_factory(calls, "old"))
+    clock[0] += 300
+    assert ttl_cache.get_or_set("key", counting_factory(calls, "new")) == "new"
+    assert calls == ["old", "new"]
+
+
+def test_ttl_cache_does_not_store_failures():
+    ttl_cache = cache.TTLCache(ttl_seconds=300)
+
+    def failing_factory():
+        raise LookupError
+
+    with pytest.raises(LookupError):
+        ttl_cache.get_or_set("key", failing_factory)
+    calls = []
+    assert ttl_cache.get_or_set("key", counting_factory(calls)) == "value"
+    assert len(calls) == 1
+
+
+def test_clear_all():
+    ttl_cache = cache.TTLCache(ttl_seconds=300)
+    calls = []
+    ttl_cache.get_or_set("key", counting_factory(calls))
+    cache.clear_all()
+    ttl_cache.get_or_set("key", counting_factory(calls))
+    assert len(calls) == 2
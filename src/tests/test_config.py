@@ -131,3 +131,25 @@ def test_config_load_environment_variables(dict_config: dict):
 )
 def test_config_init(dict_config: dict):
     config.Config(**dict_config)
+
+
+def test_config_collapses_accounts_and_permission_sets_with_wildcard():
+    statements = [
+        VALID_STATEMENT_DICT,
+        VALID_STATEMENT_DICT | {"Resource": ["*", "222222222222"]},
+        VALID_STATEMENT_DICT | {"Resource": ["333333333333"], "PermissionSet": ["ReadOnlyAccess", "*"]},
+        VALID_STATEMENT_DICT | {"Resource": ["444444444444"], "PermissionSet": "BillingAccess"},
+    ]
+    cfg = config.Config(**valid_config_dict(statements_as_json=False, group_statements_as_json=False) | {"statements": statements})
+    assert cfg.accounts == frozenset({"*"})
+    assert cfg.permission_sets == frozenset({"*"})
+
+
+def test_config_collects_explicit_accounts_and_permission_sets():
+    statements = [
+        VALID_STATEMENT_DICT,
+        VALID_STATEMENT_DICT | {"Resource": ["222222222222", "333333333333"], "PermissionSet": ["ReadOnlyAccess", "BillingAccess"]},
+    ]
+    cfg = config.Config(**valid_config_dict(statements_as_json=False, group_statements_as_json=False) | {"statements": statements})
+    assert cfg.accounts == frozenset({"111111111111", "222222222222", "333333333333"})
+    assert cfg.permission_sets == frozenset({"AdministratorAccess", "ReadOnlyAccess", "BillingAccess"})
@@ -0,0 +1,67 @@
+import pytest
+
+import cache
+import errors
+import sso
+
+# ruff: noqa
+
+
+class FakePaginator:
+    def __init__(self, pages: list[dict]):
+        self.pages = pages
+        self.calls = 0
+
+    def paginate(self, **_):
+        self.calls += 1
+        return self.pages
+
+
+class FakeIdentityStoreClient:
+    def __init__(self, users: list[dict]):
+        self.paginator = FakePaginator([{"Users": users}])
+
+    def get_paginator(self, _):
+        return self.paginator
+
+
+def test_user_principal_id_is_cached():
+    client = FakeIdentityStoreClient([{"UserId": "user-id", "Emails": [{"Value": "Email@Example.com"}]}])
+    assert sso.get_user_principal_id_by_email(client, "store", "email@example.com") == "user-id"
+    assert sso.get_user_principal_id_by_email(client, "store", "email@example.com") == "user-id"
+    assert client.paginator.calls == 1
+
+
+def test_user_principal_id_not_found_is_not_cached():
+    client = FakeIdentityStoreClient([])
+    for _ in range(2):
+        with pytest.raises(errors.NotFound):
+            sso.get_user_principal_id_by_email(client, "store", "email@example.com")
+    assert client.paginator.calls == 2
+
+
+class FakeSSOAdminClient:
+    def __init__(self, permission_sets: dict[str, str]):
+        self.permission_sets = permission_sets
+        self.describe_calls = 0
+
+    def get_paginator(self, _):
+        return FakePaginator([{"PermissionSets": list(self.permission_sets)}])
+
+    def describe_permission_set(self, InstanceArn, PermissionSetArn):
+        self.describe_calls += 1
+        return {"PermissionSet": {"Name": self.permission_sets[PermissionSetArn], "PermissionSetArn": PermissionSetArn}}
+
+
+def test_permission_set_by_name_shares_listing_and_expires(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    client = FakeSSOAdminClient({"arn:old": "Admin", "arn:other": "ReadOnly"})
+
+    assert sso.get_permission_set_by_name(client, "instance", "Admin").arn == "arn:old"
+    assert sso.get_permission_set_by_name(client, "instance", "ReadOnly").arn == "arn:other"
+    assert client.describe_calls == 2
+
+    client.permission_sets = {"arn:new": "Admin"}
+    now[0] += sso.permission_sets_cache.ttl_seconds
+    assert sso.get_permission_set_by_name(client, "instance", "Admin").arn == "arn:new"
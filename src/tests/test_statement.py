@@ -0,0 +1,23 @@
+from statement import GroupStatement, Statement
+
+# ruff: noqa
+
+
+def test_statement_hash_is_the_same_for_validated_and_constructed_statements():
+    statement = Statement.parse_obj({"resource": ["111111111111"], "permission_set": ["AdministratorAccess"]})
+    constructed = Statement.construct(**dict(statement))
+    assert hash(constructed) == hash(statement)
+    assert len({statement, constructed}) == 1
+
+
+def test_group_statement_hash_is_the_same_for_validated_and_constructed_statements():
+    statement = GroupStatement.parse_obj({"resource": ["11e111e1-e111-11ee-e111-1e11e1ee11e1"]})
+    constructed = GroupStatement.construct(**dict(statement))
+    assert hash(constructed) == hash(statement)
+    assert len({statement, constructed}) == 1
+
+
+def test_constructed_statement_detects_wildcards():
+    statement = Statement.construct(resource=frozenset(["*"]), permission_set=frozenset(["AdministratorAccess"]))
+    assert statement.affects("111111111111", "AdministratorAccess")
+    assert not statement.affects("111111111111", "ReadOnlyAccess")